@@ -1,8 +1,9 @@
 import pygame
-import textwrap
+import functools
 import os
-import copy
+import random
 import sys
+from dataclasses import dataclass, field
 
 
 # === 1. ANNOTATIONS & COORDINATE UTILITIES ===
@@ -23,6 +24,16 @@ def row_to_rank(row):
     return str(8 - row)
 
 
+def square_index(row, col):
+    """Maps a screen (row, col) to a bitboard square (a1 = 0, h8 = 63)."""
+    return (7 - row) * 8 + col
+
+
+def square_coords(square):
+    """Maps a bitboard square back to its screen (row, col)."""
+    return 7 - square // 8, square % 8
+
+
 def format_move(start_pos, end_pos, piece):
     """Formats a move for history: 'wP e2 to e4'."""
     start_row, start_col = start_pos
@@ -31,146 +42,373 @@ def format_move(start_pos, end_pos, piece):
     return move_str
 
 
-# === 2. KING SAFETY & PATH VALIDATION ===
+# === 2. BITBOARD POSITION ===
 
-def in_bounds(r, c):
-    """Checks if a given row and column are within the board boundaries."""
-    return 0 <= r < 8 and 0 <= c < 8
+FULL_BOARD = (1 << 64) - 1
+FILE_A = 0x0101010101010101
+FILE_H = 0x8080808080808080
+RANK_3 = 0x0000000000FF0000
+RANK_6 = 0x0000FF0000000000
 
 
-def is_path_clear(board, start, end):
-    """Checks if the path between start and end (exclusive) is empty."""
-    r1, c1 = start
-    r2, c2 = end
+def lsb(bb):
+    """Index of the lowest set bit of a non-empty bitboard."""
+    return (bb & -bb).bit_length() - 1
 
-    dr = (r2 - r1) // max(1, abs(r2 - r1)) if r1 != r2 else 0
-    dc = (c2 - c1) // max(1, abs(c2 - c1)) if c1 != c2 else 0
 
-    r, c = r1 + dr, c1 + dc
+def pop_lsb(bb):
+    """Returns (bb without its lowest set bit, index of that bit), for `while bb: bb, sq = pop_lsb(bb)` loops."""
+    return bb & (bb - 1), (bb & -bb).bit_length() - 1
 
-    while (r, c) != (r2, c2):
-        if board[r][c] != '':
-            return False
-        r += dr
-        c += dc
-    return True
 
+PIECES = ('wP', 'wN', 'wB', 'wR', 'wQ', 'wK', 'bP', 'bN', 'bB', 'bR', 'bQ', 'bK')
 
-def find_king(board, turn):
-    """Finds the (r, c) position of the King for the given color."""
-    if not turn:
-        return None
-    for r in range(8):
-        for c in range(8):
-            piece = board[r][c]
-            if piece == turn + 'K':
-                return r, c
-    return None
+# Piece names per color, precomputed so hot loops never build them by string concatenation
+OFFICERS = {'w': ('wN', 'wB', 'wR', 'wQ'), 'b': ('bN', 'bB', 'bR', 'bQ')}
+KINGS = {'w': 'wK', 'b': 'bK'}
+
+piece_values = {'wP': 100, 'wN': 300, 'wB': 330, 'wR': 500, 'wQ': 900, 'wK': 0,
+                'bP': -100, 'bN': -300, 'bB': -330, 'bR': -500, 'bQ': -900, 'bK': 0}
+
+INITIAL_BITBOARDS = {
+    'wP': 0x000000000000FF00, 'wN': 0x0000000000000042, 'wB': 0x0000000000000024,
+    'wR': 0x0000000000000081, 'wQ': 0x0000000000000008, 'wK': 0x0000000000000010,
+    'bP': 0x00FF000000000000, 'bN': 0x4200000000000000, 'bB': 0x2400000000000000,
+    'bR': 0x8100000000000000, 'bQ': 0x0800000000000000, 'bK': 0x1000000000000000,
+}
+
+
+# Zobrist keys: one random 64-bit number per (piece, square), XORed together to hash a position.
+# Seeded so hashes are reproducible between runs.
+zobrist_rng = random.Random(20240601)
+ZOBRIST = {piece: tuple(zobrist_rng.getrandbits(64) for _ in range(64)) for piece in PIECES}
+ZOBRIST_SIDE = zobrist_rng.getrandbits(64)  # Mixed in when Black is to move
+
+
+@dataclass
+class Position:
+    """
+    Board state stored as one 64-bit integer per piece type plus occupancy masks.
+    Square 0 is a1 and square 63 is h8. `squares` mirrors the bitboards so the
+    piece standing on a square can be read without testing all twelve boards.
+
+    Moves are played in place: make() returns an Undo record
+    (moved piece, captured piece or '', start, end) that unmake() reverts.
+    `hash` is the Zobrist key of the piece placement and `material` the sum of
+    piece_values, both kept up to date by make/unmake.
+    """
+    wP: int = 0
+    wN: int = 0
+    wB: int = 0
+    wR: int = 0
+    wQ: int = 0
+    wK: int = 0
+    bP: int = 0
+    bN: int = 0
+    bB: int = 0
+    bR: int = 0
+    bQ: int = 0
+    bK: int = 0
+    occ_w: int = 0
+    occ_b: int = 0
+    occ_all: int = 0
+    hash: int = 0
+    material: int = 0
+    squares: list = field(default_factory=lambda: [''] * 64)
+
+    def piece_at(self, row, col):
+        """Returns the piece on a screen (row, col), or '' if the square is empty."""
+        return self.squares[square_index(row, col)]
+
+    def occupancy(self, color):
+        return self.occ_w if color == 'w' else self.occ_b
+
+    def add_piece(self, piece, square):
+        bit = 1 << square
+        setattr(self, piece, getattr(self, piece) | bit)
+        if piece[0] == 'w':
+            self.occ_w |= bit
+        else:
+            self.occ_b |= bit
+        self.occ_all |= bit
+        self.hash ^= ZOBRIST[piece][square]
+        self.material += piece_values[piece]
+        self.squares[square] = piece
+
+    def toggle_move(self, piece, captured, start, end):
+        """XORs a move into (or, applied again, out of) the bitboards."""
+        move_mask = (1 << start) | (1 << end)
+        setattr(self, piece, getattr(self, piece) ^ move_mask)
+        if piece[0] == 'w':
+            self.occ_w ^= move_mask
+        else:
+            self.occ_b ^= move_mask
+        keys = ZOBRIST[piece]
+        self.hash ^= keys[start] ^ keys[end]
+
+        if captured:
+            end_bit = 1 << end
+            setattr(self, captured, getattr(self, captured) ^ end_bit)
+            if captured[0] == 'w':
+                self.occ_w ^= end_bit
+            else:
+                self.occ_b ^= end_bit
+            self.hash ^= ZOBRIST[captured][end]
+
+        self.occ_all = self.occ_w | self.occ_b
+
+    def make(self, move):
+        """Plays move = (start, end) in place and returns its Undo record."""
+        start, end = move
+        piece = self.squares[start]
+        captured = self.squares[end]
+        self.toggle_move(piece, captured, start, end)
+        if captured:
+            self.material -= piece_values[captured]
+        self.squares[end] = piece
+        self.squares[start] = ''
+        return piece, captured, start, end
+
+    def unmake(self, undo):
+        """Takes back the move recorded by make."""
+        piece, captured, start, end = undo
+        self.toggle_move(piece, captured, start, end)
+        if captured:
+            self.material += piece_values[captured]
+        self.squares[start] = piece
+        self.squares[end] = captured
+
+    def compute_hash(self):
+        """Zobrist key recomputed from scratch, to cross-check the incrementally kept `hash`."""
+        key = 0
+        for square, piece in enumerate(self.squares):
+            if piece:
+                key ^= ZOBRIST[piece][square]
+        return key
+
+
+# === 3. KING SAFETY & PATH VALIDATION ===
+
+ROOK_DIRECTIONS = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+BISHOP_DIRECTIONS = [(1, 1), (1, -1), (-1, 1), (-1, -1)]
+
+
+def in_bounds(r, c):
+    """Checks if a given row and column are within the board boundaries."""
+    return 0 <= r < 8 and 0 <= c < 8
 
 
-def check_linear_attack(board, r, c, directions, target_piece):
-    """Checks for attack along a line (Rook, Bishop, Queen)."""
+def build_between_table():
+    """BETWEEN[a][b] holds the squares strictly between a and b when they share a line, else 0."""
+    between = [[0] * 64 for _ in range(64)]
+    for start in range(64):
+        r1, c1 = divmod(start, 8)
+        for dr, dc in ROOK_DIRECTIONS + BISHOP_DIRECTIONS:
+            ray = 0
+            r, c = r1 + dr, c1 + dc
+            while in_bounds(r, c):
+                between[start][r * 8 + c] = ray
+                ray |= 1 << (r * 8 + c)
+                r += dr
+                c += dc
+    return between
+
+
+BETWEEN = build_between_table()
+
+
+KNIGHT_OFFSETS = [(2, 1), (2, -1), (-2, 1), (-2, -1), (1, 2), (1, -2), (-1, 2), (-1, -2)]
+KING_OFFSETS = [(1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1)]
+
+
+def build_leaper_table(offsets):
+    """For each square, the bitboard of destinations reachable by one of the fixed offsets."""
+    table = []
+    for square in range(64):
+        r, c = divmod(square, 8)
+        attacks = 0
+        for dr, dc in offsets:
+            if in_bounds(r + dr, c + dc):
+                attacks |= 1 << ((r + dr) * 8 + c + dc)
+        table.append(attacks)
+    return tuple(table)
+
+
+KNIGHT_ATTACKS = build_leaper_table(KNIGHT_OFFSETS)
+KING_ATTACKS = build_leaper_table(KING_OFFSETS)
+WPAWN_ATTACKS = build_leaper_table([(1, -1), (1, 1)])
+BPAWN_ATTACKS = build_leaper_table([(-1, -1), (-1, 1)])
+
+
+# Magic numbers found offline by a seeded random search. Each one maps every
+# blocker subset of a square's relevance mask to a collision-free table index.
+ROOK_MAGICS = (
+    0x2080001440022581, 0x1080200040001080, 0x4080100008200080, 0x0280080080100254,
+    0x4D8004000A180080, 0x0100080400020100, 0x1080010040800200, 0x02000400A0814502,
+    0x0800800080400021, 0x0084402000401000, 0x0102004012002080, 0x3008801000800800,
+    0x2006001060440A00, 0x1000800200800400, 0x0004000441024810, 0xA001000082004100,
+    0x0040808000204014, 0x0000424002201000, 0x0010110041002000, 0x0000090021041000,
+    0x0204008004800800, 0x0000808004000200, 0x6006040021485042, 0x0000020002409924,
+    0x2000401980028020, 0x4000400100308100, 0x0000820200201041, 0xB100100080800800,
+    0x3004080080040080, 0x0802000200041009, 0x01A0580400021110, 0x00020042000408A1,
+    0x4218884000800023, 0x0480201000400045, 0x0010200080801000, 0x1200200901001000,
+    0x0000100801000500, 0x0080020080800400, 0x004A000100404080, 0x0480005402001081,
+    0x258000402000C000, 0xA010004820084002, 0x0480200010008080, 0x244100100021000C,
+    0x2040080005010010, 0x0012000810020004, 0x0011000200B9000C, 0x1121000080410002,
+    0x00082080410A0600, 0x4002008100402600, 0x0A0300E008544100, 0x7B00080010008080,
+    0x0300080100100500, 0x0002020080040080, 0x0042521810214400, 0x8A00004089140200,
+    0x00001280010A2041, 0x0400401102042086, 0x41902000100C4101, 0x0043020420900009,
+    0x00E2000410082002, 0x4402000108041002, 0x2100101A00814804, 0x0400010400218246,
+)
+
+BISHOP_MAGICS = (
+    0x0102040418220020, 0x0108024802002028, 0x8010044040400001, 0x0022209200044800,
+    0x4004504005040114, 0x0022010420A80800, 0x0008441008090002, 0x0000420801480200,
+    0x1100220244011C00, 0x00883004081AB020, 0x4400100152002000, 0x4019080841004000,
+    0x2861021210000000, 0x400EA10108400020, 0x4800208208A24000, 0x0020A500A0842085,
+    0x3410000802504400, 0x0010E0200C010060, 0x0014182042408200, 0x4094006840112109,
+    0x2014200202010000, 0x000100020080C400, 0x800400420D2C0200, 0x0002200182251000,
+    0x0010F10304C41000, 0x001024A008281084, 0x0088110002040100, 0x0820080001004008,
+    0x0104040020410050, 0x0110002027040500, 0x418C008009182100, 0x2C00A9040C80480B,
+    0x008110C8005020A4, 0x4004210802041000, 0x0004020108208100, 0x0000080800120A00,
+    0x430C008400820102, 0x1400808100020108, 0x005006020010A8A0, 0x000801868004A220,
+    0x00420105C00C2000, 0x1010921032019040, 0x0300222028103000, 0x0008004208001080,
+    0x5410202248811400, 0x0008010800800808, 0x3C02C20404000900, 0x0408022282040032,
+    0x0000941002100000, 0x0112209A10100804, 0x080C020111210000, 0x442002A442022008,
+    0x00084A181B040000, 0x00115021021C2080, 0x4010051000A20000, 0x0404688085060000,
+    0x0000220110011000, 0x140000220734200C, 0x0440010424020800, 0x2204828883460800,
+    0x0020000004050410, 0x4060004A20082080, 0x00489034B002C201, 0x0444049010410300,
+)
+
+
+def sliding_attacks(square, occupancy, directions):
+    """Walks each ray until it leaves the board or hits a blocker. Used to fill the magic tables."""
+    r, c = divmod(square, 8)
+    attacks = 0
     for dr, dc in directions:
         nr, nc = r + dr, c + dc
         while in_bounds(nr, nc):
-            piece = board[nr][nc]
-            if piece != '':
-                if piece == target_piece:
-                    return True
+            bit = 1 << (nr * 8 + nc)
+            attacks |= bit
+            if occupancy & bit:
                 break
             nr += dr
             nc += dc
-    return False
+    return attacks
 
 
-# Dedicated attack check functions (used by is_square_attacked and check_kings_safety)
-def check_king_attack(board, r, c, enemy_king):
-    for dr in [-1, 0, 1]:
-        for dc in [-1, 0, 1]:
-            if dr == 0 and dc == 0: continue
-            nr, nc = r + dr, c + dc
-            if in_bounds(nr, nc) and board[nr][nc] == enemy_king:
-                return True
-    return False
+def relevance_mask(square, directions):
+    """Squares whose occupancy can block a slider on square (the last square of each ray never can)."""
+    r, c = divmod(square, 8)
+    mask = 0
+    for dr, dc in directions:
+        nr, nc = r + dr, c + dc
+        while in_bounds(nr + dr, nc + dc):
+            mask |= 1 << (nr * 8 + nc)
+            nr += dr
+            nc += dc
+    return mask
+
+
+def build_magic_tables(magics, directions):
+    """Returns per-square (masks, shifts, attack tables) for a slider's magic lookup."""
+    masks, shifts, tables = [], [], []
+    for square in range(64):
+        mask = relevance_mask(square, directions)
+        shift = 64 - mask.bit_count()
+        table = [0] * (1 << mask.bit_count())
+
+        # Enumerate every subset of the mask (Carry-Rippler trick)
+        blockers = 0
+        while True:
+            index = ((blockers * magics[square]) & FULL_BOARD) >> shift
+            table[index] = sliding_attacks(square, blockers, directions)
+            blockers = (blockers - mask) & mask
+            if not blockers:
+                break
 
+        masks.append(mask)
+        shifts.append(shift)
+        tables.append(table)
+    return tuple(masks), tuple(shifts), tuple(tables)
 
-def check_knight_attack(board, r, c, enemy_knight):
-    for dr, dc in [(2, 1), (2, -1), (-2, 1), (-2, -1), (1, 2), (1, -2), (-1, 2), (-1, -2)]:
-        nr, nc = r + dr, c + dc
-        if in_bounds(nr, nc) and board[nr][nc] == enemy_knight:
-            return True
-    return False
 
+ROOK_MASKS, ROOK_SHIFTS, ROOK_ATTACKS = build_magic_tables(ROOK_MAGICS, ROOK_DIRECTIONS)
+BISHOP_MASKS, BISHOP_SHIFTS, BISHOP_ATTACKS = build_magic_tables(BISHOP_MAGICS, BISHOP_DIRECTIONS)
 
-def check_pawn_attack(board, r, c, enemy_pawn):
-    direction = -1 if enemy_pawn[0] == 'b' else 1
-    for dc in [-1, 1]:
-        nr, nc = r + direction, c + dc
-        if in_bounds(nr, nc) and board[nr][nc] == enemy_pawn:
-            return True
-    return False
+
+def rook_attacks(square, occupancy):
+    """Squares a rook on square attacks given the board occupancy (one table load)."""
+    index = ((occupancy & ROOK_MASKS[square]) * ROOK_MAGICS[square] & FULL_BOARD) >> ROOK_SHIFTS[square]
+    return ROOK_ATTACKS[square][index]
+
+
+def bishop_attacks(square, occupancy):
+    """Squares a bishop on square attacks given the board occupancy (one table load)."""
+    index = ((occupancy & BISHOP_MASKS[square]) * BISHOP_MAGICS[square] & FULL_BOARD) >> BISHOP_SHIFTS[square]
+    return BISHOP_ATTACKS[square][index]
+
+
+def queen_attacks(square, occupancy):
+    return rook_attacks(square, occupancy) | bishop_attacks(square, occupancy)
+
+
+def find_king(board, turn):
+    """Finds the square of the King for the given color."""
+    if not turn:
+        return None
+    king_bb = board.wK if turn == 'w' else board.bK
+    if not king_bb:
+        return None
+    return lsb(king_bb)
 
 
-def check_rook_attack(board, r, c, enemy_rook):
-    return check_linear_attack(board, r, c, [(1, 0), (-1, 0), (0, 1), (0, -1)], enemy_rook)
+def attackers_to(board, square, attacker_color):
+    """Returns the bitboard of attacker_color pieces that attack square."""
+    occ = board.occ_all
+    if attacker_color == 'w':
+        return (BPAWN_ATTACKS[square] & board.wP | KNIGHT_ATTACKS[square] & board.wN
+                | KING_ATTACKS[square] & board.wK
+                | rook_attacks(square, occ) & (board.wR | board.wQ)
+                | bishop_attacks(square, occ) & (board.wB | board.wQ))
+    return (WPAWN_ATTACKS[square] & board.bP | KNIGHT_ATTACKS[square] & board.bN
+            | KING_ATTACKS[square] & board.bK
+            | rook_attacks(square, occ) & (board.bR | board.bQ)
+            | bishop_attacks(square, occ) & (board.bB | board.bQ))
 
 
-def check_bishop_attack(board, r, c, enemy_bishop):
-    return check_linear_attack(board, r, c, [(1, 1), (1, -1), (-1, 1), (-1, -1)], enemy_bishop)
+def compute_pins(board, king_sq, us):
+    """
+    Returns (pinned_bb, pin_ray) for the side `us`. A pinned piece may only move
+    along pin_ray[square]: the squares between its King and the pinner, plus the pinner.
+    """
+    if us == 'w':
+        own, their = board.occ_w, board.occ_b
+        straight, diagonal = board.bR | board.bQ, board.bB | board.bQ
+    else:
+        own, their = board.occ_b, board.occ_w
+        straight, diagonal = board.wR | board.wQ, board.wB | board.wQ
 
+    # Enemy sliders that would attack the King if our own pieces were transparent
+    snipers = rook_attacks(king_sq, their) & straight | bishop_attacks(king_sq, their) & diagonal
 
-def check_queen_attack(board, r, c, enemy_queen):
-    return check_linear_attack(board, r, c, [(1, 0), (-1, 0), (0, 1), (0, -1),
-                                             (1, 1), (1, -1), (-1, 1), (-1, -1)], enemy_queen)
+    pinned_bb = 0
+    pin_ray = {}
+    while snipers:
+        snipers, sniper = pop_lsb(snipers)
+        blockers = BETWEEN[king_sq][sniper] & own
+        if blockers and not blockers & (blockers - 1):
+            pinned_bb |= blockers
+            pin_ray[lsb(blockers)] = BETWEEN[king_sq][sniper] | (1 << sniper)
+    return pinned_bb, pin_ray
 
 
 def is_square_attacked(board, square, attacker_color):
     """
     Checks if a square is attacked by any piece of the attacker_color.
-    This consolidated function uses the dedicated attack checks.
+    Pure attack-table lookups: no move legality is consulted, so there is no recursion.
     """
-    r_target, c_target = square
-
-    # Define enemy pieces to look for
-    opponent_pieces = {
-        'P': attacker_color + 'P', 'N': attacker_color + 'N', 'B': attacker_color + 'B',
-        'R': attacker_color + 'R', 'Q': attacker_color + 'Q', 'K': attacker_color + 'K'
-    }
-
-    # Iterate through all squares to find attacking pieces
-    for r in range(8):
-        for c in range(8):
-            piece = board[r][c]
-            if not piece or piece[0] != attacker_color:
-                continue
-
-            piece_type = piece[1]
-            enemy_piece_str = opponent_pieces[piece_type]
-
-            # Temporarily replace the target square's content with the piece we're checking
-            # This is crucial for *move* validation, but here we just check attack from a fixed piece.
-            # We must use the piece's move logic: can the piece at (r, c) move to (r_target, c_target)?
-
-            # Since the user's logic relies on the complex attack checks:
-            if piece_type == 'P':
-                # Pawn attacks are directional, so we check if the target square is a capture square
-                direction = -1 if attacker_color == 'w' else 1
-                if r_target == r + direction and abs(c_target - c) == 1:
-                    return True
-            elif piece_type == 'N':
-                if abs(r_target - r) in [1, 2] and abs(c_target - c) in [1, 2] and abs(r_target - r) != abs(
-                        c_target - c):
-                    return True
-            # For linear pieces, we use the specific attack checks which handle path clearance
-            # by pretending the target square holds the piece we want to check safety for (a weak point).
-            # A simpler way is to check if is_legal_move_basic(board, (r,c), (r_target, c_target), attacker_color) is True
-            # For correctness, we will use the dedicated check functions which are proven to work:
-
-            # The most accurate method for attack is to check if the attacker can move to the target:
-            if is_legal_move_basic(board, (r, c), (r_target, c_target), attacker_color):
-                return True
-
-    return False
+    return bool(attackers_to(board, square, attacker_color))
 
 
 def is_king_in_check(board, king_color):
@@ -194,121 +432,120 @@ def check_kings_safety(board):
     return None
 
 
-# === 3. PIECE MOVEMENT VALIDATION (BASIC GEOMETRY) ===
+# === 4. PIECE MOVEMENT VALIDATION (BASIC GEOMETRY) ===
+# Squares are bitboard indices; divmod(square, 8) gives (rank, file) with rank 0 = White's back rank.
+
+def generate_pawn_moves(board, piece_color, target_mask=FULL_BOARD):
+    """
+    Returns every pawn move of piece_color as (start, end) squares, restricted to target_mask.
+    All pawns are shifted at once; each target set is then walked with pop_lsb.
+    En passant and promotion are not part of this game's rules.
+    """
+    empty = ~board.occ_all
+    if piece_color == 'w':
+        pawns = board.wP
+        single = (pawns << 8) & FULL_BOARD & empty
+        double = ((single & RANK_3) << 8) & empty
+        capture_left = (pawns << 7) & ~FILE_H & board.occ_b
+        capture_right = (pawns << 9) & ~FILE_A & board.occ_b
+        shifts = ((single, -8), (double, -16), (capture_left, -7), (capture_right, -9))
+    else:
+        pawns = board.bP
+        single = (pawns >> 8) & empty
+        double = ((single & RANK_6) >> 8) & empty
+        capture_left = (pawns >> 9) & ~FILE_H & board.occ_w
+        capture_right = (pawns >> 7) & ~FILE_A & board.occ_w
+        shifts = ((single, 8), (double, 16), (capture_left, 9), (capture_right, 7))
+
+    moves = []
+    for targets, back in shifts:
+        targets &= target_mask
+        while targets:
+            targets, end = pop_lsb(targets)
+            moves.append((end + back, end))
+    return moves
+
+
+def move_targets(board, square, piece):
+    """Bitboard of squares the (non-pawn) piece on square can move to by its geometry (King safety not checked)."""
+    piece_color, piece_type = piece
+    occ = board.occ_all
+    own = board.occupancy(piece_color)
+
+    if piece_type == 'N':
+        return KNIGHT_ATTACKS[square] & ~own
+    if piece_type == 'B':
+        return bishop_attacks(square, occ) & ~own
+    if piece_type == 'R':
+        return rook_attacks(square, occ) & ~own
+    if piece_type == 'Q':
+        return queen_attacks(square, occ) & ~own
+    return KING_ATTACKS[square] & ~own
+
 
 def is_legal_move_pawn(board, start, end, turn):
-    r1, c1 = start
-    r2, c2 = end
-    direction = -1 if turn == 'w' else 1
-    start_row = 6 if turn == 'w' else 1
-    target = board[r2][c2]
+    r1, c1 = divmod(start, 8)
+    r2, c2 = divmod(end, 8)
+    direction = 1 if turn == 'w' else -1
+    start_row = 1 if turn == 'w' else 6
+    end_bit = 1 << end
 
     if c1 == c2:
-        if r2 - r1 == direction and target == '':
-            return True
-        if r1 == start_row and r2 - r1 == 2 * direction and board[r1 + direction][c1] == '' and target == '':
+        if r2 - r1 == direction and not board.occ_all & end_bit:
             return True
-    elif abs(c2 - c1) == 1 and r2 - r1 == direction and target != '' and target[0] != turn:
+        if r1 == start_row and r2 - r1 == 2 * direction:
+            step_bit = 1 << (start + 8 * direction)
+            if not board.occ_all & (step_bit | end_bit):
+                return True
+    elif abs(c2 - c1) == 1 and r2 - r1 == direction and board.occupancy(switch_turn(turn)) & end_bit:
         return True
     return False
 
 
 def is_legal_move_rook(board, start, end, turn):
-    r1, c1 = start
-    r2, c2 = end
-    if r1 != r2 and c1 != c2:
-        return False
-    if not is_path_clear(board, start, end):
-        return False
-    target = board[r2][c2]
-    return target == '' or target[0] != turn
+    targets = rook_attacks(start, board.occ_all) & ~board.occupancy(turn)
+    return bool((targets >> end) & 1)
 
 
 def is_legal_move_bishop(board, start, end, turn):
-    r1, c1 = start
-    r2, c2 = end
-    if abs(r2 - r1) != abs(c2 - c1):
-        return False
-    if not is_path_clear(board, start, end):
-        return False
-    target = board[r2][c2]
-    return target == '' or target[0] != turn
+    targets = bishop_attacks(start, board.occ_all) & ~board.occupancy(turn)
+    return bool((targets >> end) & 1)
 
 
 def is_legal_move_queen(board, start, end, turn):
-    return is_legal_move_rook(board, start, end, turn) or is_legal_move_bishop(board, start, end, turn)
+    targets = queen_attacks(start, board.occ_all) & ~board.occupancy(turn)
+    return bool((targets >> end) & 1)
 
 
 def is_legal_move_knight(board, start, end, turn):
-    r1, c1 = start
-    r2, c2 = end
-    knight_moves = {
-        (2, 1), (2, -1), (-2, 1), (-2, -1),
-        (1, 2), (1, -2), (-1, 2), (-1, -2)
-    }
-    if (r2 - r1, c2 - c1) not in knight_moves:
-        return False
-    target = board[r2][c2]
-    return target == '' or target[0] != turn
-
+    end_bit = 1 << end
+    return bool(KNIGHT_ATTACKS[start] & end_bit) and not board.occupancy(turn) & end_bit
 
-def is_legal_move_king(board, start, end, turn):
-    """Checks basic King move + ensures it does NOT move into check."""
-    r1, c1 = start
-    r2, c2 = end
 
-    # Basic geometric move check
-    if max(abs(r2 - r1), abs(c2 - c1)) > 1:
-        return False
-
-    piece = board[r1][c1]
-    captured = board[r2][c2]
-
-    # Check if moving onto your own piece (redundant, but keeping it safe)
-    if captured != '' and captured[0] == turn:
-        return False
-
-    # Simulate the move
-    board[r2][c2] = piece
-    board[r1][c1] = ''
-
-    # Check if the King is safe in the new position (using the opponent's color)
-    opponent_color = 'b' if turn == 'w' else 'w'
-    is_safe = not is_square_attacked(board, end, opponent_color)
-
-    # Undo the move (Crucial Fix)
-    board[r1][c1] = piece
-    board[r2][c2] = captured
-
-    return is_safe
-
-
-def is_legal_move_basic(board, start, end, turn):
+def pseudo_legal(board, start, end, turn):
     """
     Consolidated function to check if a move is legal based on piece rules,
-    but without the safety check, EXCEPT for the King's move which must
-    always include safety checks.
+    but without the safety check. Callers reject moves that leave their
+    own King in check with a single is_king_in_check after making the move.
     """
-    r1, c1 = start
-    r2, c2 = end
-    if not (0 <= r1 < 8 and 0 <= c1 < 8 and 0 <= r2 < 8 and 0 <= c2 < 8):
+    if not (0 <= start < 64 and 0 <= end < 64):
         return False
-    piece = board[r1][c1]
+    piece = board.squares[start]
     if not piece or piece[0] != turn:
         return False
-    target = board[r2][c2]
-    if target != '' and target[0] == turn:
+    if board.occupancy(turn) & (1 << end):
         return False
-    if r1 == r2 and c1 == c2:
+    if start == end:
         return False
 
     piece_type = piece[1]
 
-    # King's move must use its specialized function that includes safety
     if piece_type == 'K':
-        return is_legal_move_king(board, start, end, turn)
+        r1, c1 = divmod(start, 8)
+        r2, c2 = divmod(end, 8)
+        return max(abs(r2 - r1), abs(c2 - c1)) <= 1
 
-        # All other pieces use the geometric checks
+    # All other pieces use the geometric checks
     if piece_type == 'P':
         return is_legal_move_pawn(board, start, end, turn)
     elif piece_type == 'R':
@@ -323,17 +560,14 @@ def is_legal_move_basic(board, start, end, turn):
     return False
 
 
-is_legal_move = is_legal_move_basic  # Alias used in AI functions
-
-
-# === 4. GAME STATE & MOVE EXECUTION ===
+# === 5. GAME STATE & MOVE EXECUTION ===
 
 def create_initial_board():
-    board = [['' for _ in range(8)] for _ in range(8)]
-    board[0] = ['bR', 'bN', 'bB', 'bQ', 'bK', 'bB', 'bN', 'bR']
-    board[1] = ['bP'] * 8
-    board[6] = ['wP'] * 8
-    board[7] = ['wR', 'wN', 'wB', 'wQ', 'wK', 'wB', 'wN', 'wR']
+    board = Position()
+    for piece, bitboard in INITIAL_BITBOARDS.items():
+        while bitboard:
+            bitboard, square = pop_lsb(bitboard)
+            board.add_piece(piece, square)
     return board
 
 
@@ -342,26 +576,22 @@ def switch_turn(turn):
 
 
 def make_move(board, start, end, turn, move_history, captured_pieces):
-    r1, c1 = start
-    r2, c2 = end
+    """Plays a move given as screen (row, col) squares; returns False if it is illegal."""
+    start_sq = square_index(*start)
+    end_sq = square_index(*end)
 
-    # 1. Basic legality check (including King safety via is_legal_move_king)
-    if not is_legal_move_basic(board, start, end, turn):
+    # 1. Basic legality check (piece geometry only)
+    if not pseudo_legal(board, start_sq, end_sq, turn):
         return False
 
-    piece = board[r1][c1]
-    captured = board[r2][c2]
-
-    # 2. Temporarily make the move (if King, it's already done in is_legal_move_king,
-    # but we must do it here for all other pieces)
-    board[r2][c2] = piece
-    board[r1][c1] = ''
+    # 2. Make the move on the bitboards
+    undo = board.make((start_sq, end_sq))
+    piece, captured, _, _ = undo
 
-    # 3. Check if this move *exposes* a check on the King
+    # 3. Check if this move leaves (or puts) the own King in check
     if is_king_in_check(board, turn):
         # Undo move if it leaves king in check
-        board[r1][c1] = piece
-        board[r2][c2] = captured
+        board.unmake(undo)
         return False
 
     # 4. Finalize move
@@ -373,103 +603,208 @@ def make_move(board, start, end, turn, move_history, captured_pieces):
     return True
 
 
-# === 5. AI (NEGAMAX) LOGIC ===
+# === 6. AI (NEGAMAX) LOGIC ===
 
-piece_values = {'wP': 100, 'wN': 300, 'wB': 330, 'wR': 500, 'wQ': 900, 'wK': 0,
-                'bP': -100, 'bN': -300, 'bB': -330, 'bR': -500, 'bQ': -900, 'bK': 0}
+# Screen rows 3-6 (ranks 5 down to 2) count as an exposed King, whichever side it belongs to
+KING_EXPOSED_ZONE = 0x000000FFFFFFFF00
+KING_EXPOSED_PENALTY = -20
 
+INF = 1_000_000_000  # Search bound; an int keeps every score comparison on the integer fast path
+ASPIRATION_WINDOW = 50  # Half a pawn either side of the previous iteration's score
 
-def make_possible_move(board, start, end):
-    """Creates a new board state after executing a move."""
-    new_board = [row[:] for row in board]
-    (r1, c1), (r2, c2) = start, end
-    piece = new_board[r1][c1]
+# Move ordering: the transposition-table move, winning captures, then the two killer moves
+# of the ply, then losing captures, then quiet moves
+TT_MOVE_SCORE = 100000
+WINNING_CAPTURE_BONUS = 10000
+KILLER_SCORES = (9000, 8000)
 
-    new_board[r2][c2] = piece
-    new_board[r1][c1] = ''
+killer_moves = {}  # ply -> [newest, older] quiet moves that caused a beta cutoff
 
-    return new_board
+# Transposition table flags: the stored score is exact, a lower bound (beta cutoff) or an upper bound (fail low)
+TT_EXACT, TT_LOWER, TT_UPPER = 0, 1, 2
 
+transposition_table = {}  # Zobrist key -> (depth, score, flag, best_move)
 
-def all_moves(board, color):
-    """Returns all legal and SAFE moves for given color (1=w, -1=b)."""
+
+def all_moves(board, color, captures_only=False):
+    """
+    Returns all legal and SAFE moves for given color (1=w, -1=b) as (start, end) squares.
+    With captures_only, destinations are restricted to squares holding an enemy piece.
+    """
     moves = []
     piece_color = 'w' if color == 1 else 'b'
+    king_sq = find_king(board, piece_color)
+    if king_sq is None:
+        return moves
+    destination_mask = board.occupancy(switch_turn(piece_color)) if captures_only else FULL_BOARD
+
+    # Pins and checks are worked out once, so only King moves need a make/is_king_in_check round trip
+    pinned_bb, pin_ray = compute_pins(board, king_sq, piece_color)
+    checkers = attackers_to(board, king_sq, switch_turn(piece_color))
+    if not checkers:
+        check_mask = FULL_BOARD
+    elif checkers & (checkers - 1):
+        check_mask = 0  # Double check: only the King may move
+    else:
+        # Single check: capture the checker or block the line to it
+        check_mask = checkers | BETWEEN[king_sq][lsb(checkers)]
+    check_mask &= destination_mask
+
+    if check_mask:
+        for start, end in generate_pawn_moves(board, piece_color, check_mask):
+            if not pinned_bb & (1 << start) or pin_ray[start] & (1 << end):
+                moves.append((start, end))
+
+        for piece in OFFICERS[piece_color]:
+            pieces = getattr(board, piece)
+            while pieces:
+                pieces, start = pop_lsb(pieces)
+
+                targets = move_targets(board, start, piece) & check_mask
+                if pinned_bb & (1 << start):
+                    targets &= pin_ray[start]
+                while targets:
+                    targets, end = pop_lsb(targets)
+                    moves.append((start, end))
+
+    targets = move_targets(board, king_sq, KINGS[piece_color]) & destination_mask
+    while targets:
+        targets, end = pop_lsb(targets)
+
+        undo = board.make((king_sq, end))
+
+        # King Safety Check: The move must not leave the King in check
+        if not is_king_in_check(board, piece_color):
+            moves.append((king_sq, end))
+        board.unmake(undo)
+    return moves
 
-    for r1 in range(8):
-        for c1 in range(8):
-            piece = board[r1][c1]
-            if piece and piece.startswith(piece_color):
-                for r2 in range(8):
-                    for c2 in range(8):
-                        move = ((r1, c1), (r2, c2))
 
-                        # Use the top-level move check (is_legal_move_basic)
-                        if is_legal_move_basic(board, (r1, c1), (r2, c2), piece_color):
+def piece_val_score(board_state):
+    """Recounts material from the bitboards; the search reads the incremental Position.material instead."""
+    return sum(piece_values[piece] * getattr(board_state, piece).bit_count() for piece in PIECES)
 
-                            temp_board = make_possible_move(board, (r1, c1), (r2, c2))
 
-                            # King Safety Check: The move must not leave the King in check
-                            if not is_king_in_check(temp_board, piece_color):
-                                moves.append(move)
-    return moves
+def king_safety_score(board_state, color):
+    king = board_state.wK if color == 1 else board_state.bK
+    return KING_EXPOSED_PENALTY if king & KING_EXPOSED_ZONE else 0
 
 
-def game_over(board, color):
-    """Returns True if the current player has no legal moves."""
-    return not all_moves(board, color)
+def evaluate(board_state, color):
+    score = color * board_state.material + king_safety_score(board_state, color)
+    return score
 
 
-def piece_val_score(board_state):
-    score = 0
-    for row in board_state:
-        for square in row:
-            if square != '':
-                score += piece_values.get(square, 0)
-    return score
+def order_moves(board, moves, ply, tt_move=None):
+    """Sorts moves best-first so alpha-beta finds cutoffs early (TT move, MVV-LVA captures, killer moves)."""
+    killers = killer_moves.get(ply, ())
+
+    def move_score(move):
+        if move == tt_move:
+            return TT_MOVE_SCORE
+        start, end = move
+        captured = board.squares[end]
+        if captured:
+            victim = abs(piece_values[captured])
+            attacker = abs(piece_values[board.squares[start]])
+            score = victim - attacker // 10
+            return score + WINNING_CAPTURE_BONUS if victim >= attacker else score
+        if move in killers:
+            return KILLER_SCORES[killers.index(move)]
+        return 0
+
+    moves.sort(key=move_score, reverse=True)
+    return moves
 
 
-def king_safety_score(board_state, color):
-    king = "wK" if color == 1 else "bK"
-    score = 0
-    for row in range(len(board_state)):
-        for column in range(len(board_state[row])):
-            if board_state[row][column] == king:
-                if 3 <= row <= 6:
-                    score -= 20
-    return score
+def store_killer(move, ply):
+    killers = killer_moves.setdefault(ply, [None, None])
+    if killers[0] != move:
+        killers[1] = killers[0]
+        killers[0] = move
 
 
-def evaluate(board_state, color):
-    score = color * piece_val_score(board_state) + king_safety_score(board_state, color)
-    return score
+def quiesce(board, alpha, beta, color, ply):
+    """
+    Extends the search past depth 0 with captures only, so a leaf is never scored in the
+    middle of an exchange. The side to move may also stand pat on the static evaluation.
+    """
+    stand_pat = evaluate(board, color)
+    if stand_pat >= beta:
+        return stand_pat
+    alpha = max(alpha, stand_pat)
+
+    max_score = stand_pat
+    for move in order_moves(board, all_moves(board, color, captures_only=True), ply):
+        undo = board.make(move)
+        score = -quiesce(board, -beta, -alpha, -color, ply + 1)
+        board.unmake(undo)
+
+        max_score = max(max_score, score)
+        alpha = max(alpha, score)
+        if alpha >= beta:
+            break
+    return max_score
 
 
-def negamax(board, depth, alpha, beta, color):
-    if depth == 0 or game_over(board, color):
+def negamax(board, depth, alpha, beta, color, ply=0):
+    if depth == 0:
+        return quiesce(board, alpha, beta, color, ply)
+
+    key = board.hash if color == 1 else board.hash ^ ZOBRIST_SIDE
+    entry = transposition_table.get(key)
+    tt_move = None
+    if entry is not None:
+        entry_depth, entry_score, entry_flag, tt_move = entry
+        if entry_depth >= depth:
+            if entry_flag == TT_EXACT:
+                return entry_score
+            if entry_flag == TT_LOWER and entry_score >= beta:
+                return entry_score
+            if entry_flag == TT_UPPER and entry_score <= alpha:
+                return entry_score
+
+    moves = all_moves(board, color)
+    if not moves:
         return evaluate(board, color)
 
-    max_score = -float('inf')
-    for move in all_moves(board, color):
-        next_board = make_possible_move(board, move[0], move[1])
-        score = -negamax(next_board, depth - 1, -beta, -alpha, -color)
+    original_alpha = alpha
+    max_score = -INF
+    best_move = None
+    for move in order_moves(board, moves, ply, tt_move):
+        undo = board.make(move)
+        score = -negamax(board, depth - 1, -beta, -alpha, -color, ply + 1)
+        board.unmake(undo)
 
-        max_score = max(max_score, score)
+        if score > max_score:
+            max_score = score
+            best_move = move
         alpha = max(alpha, score)
         if alpha >= beta:
+            # Quiet moves that refute a line are likely to refute its siblings too
+            if not undo[1]:
+                store_killer(move, ply)
             break
+
+    if max_score <= original_alpha:
+        flag = TT_UPPER
+    elif max_score >= beta:
+        flag = TT_LOWER
+    else:
+        flag = TT_EXACT
+    transposition_table[key] = (depth, max_score, flag, best_move)
     return max_score
 
 
-def bot_plays(board, depth, color):
-    best_score = -float('inf')
+def search_root(board, depth, color, alpha, beta, prev_best=None):
+    """Searches every root move to depth, trying prev_best first; returns (best_move, best_score)."""
+    best_score = -INF
     best_move = None
-    alpha = -float('inf')
-    beta = float('inf')
 
-    for move in all_moves(board, color):
-        new_board = make_possible_move(board, move[0], move[1])
-        score = -negamax(new_board, depth - 1, -beta, -alpha, -color)
+    for move in order_moves(board, all_moves(board, color), 0, prev_best):
+        undo = board.make(move)
+        score = -negamax(board, depth - 1, -beta, -alpha, -color, 1)
+        board.unmake(undo)
 
         if score > best_score:
             best_score = score
@@ -478,9 +813,29 @@ def bot_plays(board, depth, color):
         alpha = max(alpha, score)
         if alpha >= beta:
             break
+    return best_move, best_score
+
+
+def bot_plays(board, depth, color):
+    """
+    Iterative deepening: searches depth 1, 2, ... up to depth, each iteration seeded with the
+    previous best move and a narrow aspiration window around the previous score.
+    """
+    killer_moves.clear()
+    transposition_table.clear()
+
+    best_move, best_score = search_root(board, 1, color, -INF, INF)
+    for current_depth in range(2, depth + 1):
+        alpha = best_score - ASPIRATION_WINDOW
+        beta = best_score + ASPIRATION_WINDOW
+        move, score = search_root(board, current_depth, color, alpha, beta, best_move)
+        if score <= alpha or score >= beta:
+            # The score left the window, so it is only a bound: search again with a full window
+            move, score = search_root(board, current_depth, color, -INF, INF, best_move)
+        best_move, best_score = move, score
     return best_move
 
-# === 6. PYGAME GRAPHICS & MAIN LOOP ===
+# === 7. PYGAME GRAPHICS & MAIN LOOP ===
 
 def load_images(tile_size):
     pieces = ['wP', 'wR', 'wN', 'wB', 'wQ', 'wK', 'bP', 'bR', 'bN', 'bB', 'bQ', 'bK']
@@ -502,38 +857,69 @@ def load_images(tile_size):
     return images
 
 
-def render_wrapped_text(lines, x, y, max_width, font, color):
-    if isinstance(lines, str):
-        lines = textwrap.wrap(lines, width=30)
-    for i, line in enumerate(lines):
-        text_surface = font.render(line, True, color)
-        screen.blit(text_surface, (x, y + i * text_surface.get_height()))
+@functools.lru_cache(maxsize=512)
+def render_cached(text, color):
+    """Renders text in font_small once per (text, color tuple) and reuses the Surface on later frames."""
+    return font_small.render(text, True, color)
 
 
-def Draw_board(light_color, dark_color, meow_mode, piece_images, font):
-    board_start_x = LABEL_MARGIN
-    board_start_y = 10
+def render_coordinate_labels(font):
+    """Pre-renders the file letters (a-h) and rank numbers (8-1) drawn around the board."""
+    file_labels = tuple(font.render(chr(97 + col), True, 'black') for col in range(8))
+    rank_labels = tuple(font.render(str(8 - row), True, 'black') for row in range(8))
+    return file_labels, rank_labels
 
-    danger = check_kings_safety(board)
-    king_in_check_pos = find_king(board, danger) if danger else None
 
+def build_board_surface(light_color, dark_color):
+    """Pre-renders the empty 8x8 checkerboard (tiles and outlines) for one theme."""
+    surface = pygame.Surface((BOARD_WIDTH, BOARD_HEIGHT))
     for row in range(8):
         for col in range(8):
             color = light_color if (row + col) % 2 == 0 else dark_color
-            x = board_start_x + col * TILE_SIZE
-            y = board_start_y + row * TILE_SIZE
+            x = col * TILE_SIZE
+            y = row * TILE_SIZE
+            pygame.draw.rect(surface, color, [x, y, TILE_SIZE, TILE_SIZE])
+            pygame.draw.rect(surface, 'black', [x, y, TILE_SIZE, TILE_SIZE], 1)
+    return surface
 
-            if king_in_check_pos == (row, col):
-                pygame.draw.rect(screen, 'firebrick1', [x, y, TILE_SIZE, TILE_SIZE])
-            elif (row, col) == move_start:
-                pygame.draw.rect(screen, 'yellow', [x, y, TILE_SIZE, TILE_SIZE])
-            else:
-                pygame.draw.rect(screen, color, [x, y, TILE_SIZE, TILE_SIZE])
 
-            pygame.draw.rect(screen, 'black', [x, y, TILE_SIZE, TILE_SIZE], 1)
-            piece = board[row][col]
-            if piece in piece_images:
-                screen.blit(piece_images[piece], (x, y))
+def Draw_board(light_color, dark_color, meow_mode, piece_images, font):
+    """Draws the board and side panel; returns the screen rects that differ from the previous frame."""
+    board_start_x = LABEL_MARGIN
+    board_start_y = 10
+
+    danger = check_kings_safety(board)
+    king_sq = find_king(board, danger) if danger else None
+    king_in_check_pos = square_coords(king_sq) if king_sq is not None else None
+
+    # Static checkerboard: one blit of the surface pre-rendered for this theme
+    if (light_color, dark_color) not in board_surfaces:
+        board_surfaces[(light_color, dark_color)] = build_board_surface(light_color, dark_color)
+    screen.blit(board_surfaces[(light_color, dark_color)], (board_start_x, board_start_y))
+
+    # Highlighted squares (King in check, selected piece) are painted over the cached board
+    highlights = []
+    if king_in_check_pos is not None:
+        highlights.append((king_in_check_pos, 'firebrick1'))
+    if move_start is not None and move_start != king_in_check_pos:
+        highlights.append((move_start, 'yellow'))
+
+    for (row, col), highlight in highlights:
+        x = board_start_x + col * TILE_SIZE
+        y = board_start_y + row * TILE_SIZE
+        pygame.draw.rect(screen, highlight, [x, y, TILE_SIZE, TILE_SIZE])
+        pygame.draw.rect(screen, 'black', [x, y, TILE_SIZE, TILE_SIZE], 1)
+
+    highlight_at = {square_index(row, col): highlight for (row, col), highlight in highlights}
+    tiles = tuple((piece, highlight_at.get(square)) for square, piece in enumerate(board.squares))
+
+    occupied = board.occ_all
+    while occupied:
+        occupied, square = pop_lsb(occupied)
+        piece = board.squares[square]
+        if piece in piece_images:
+            row, col = square_coords(square)
+            screen.blit(piece_images[piece], (board_start_x + col * TILE_SIZE, board_start_y + row * TILE_SIZE))
 
     pygame.draw.rect(screen, 'black', [board_start_x, board_start_y, BOARD_WIDTH, BOARD_HEIGHT], 4)
 
@@ -555,31 +941,24 @@ def Draw_board(light_color, dark_color, meow_mode, piece_images, font):
     restart_rect = pygame.Rect(button_x, button_y, button_width, button_height)
 
     mouse_x, mouse_y = pygame.mouse.get_pos()
-    if restart_rect.collidepoint(mouse_x, mouse_y):
+    hovered = restart_rect.collidepoint(mouse_x, mouse_y)
+    if hovered:
         pygame.draw.rect(screen, 'darkblue', restart_rect)
     else:
         pygame.draw.rect(screen, 'lightblue', restart_rect)
 
-    restart_text = big_font.render("Click to Restart", True, 'black')
-    screen.blit(restart_text, (button_x + 10, button_y + 15))
-
-    # Status Messages
-    if danger == 'w':
-        status_msg = "White king is in check!"
-    elif danger == 'b':
-        status_msg = "Black king is in check!"
-    else:
-        status_msg = "  `\\_(^-^)_/`  "
+    screen.blit(restart_surface, (button_x + 10, button_y + 15))
 
-    lines = [f"Turn: {'White' if turn == 'w' else 'Black'}", status_msg, "Press C to change theme"]
-    render_wrapped_text(lines, panel_x, 20, panel_width - 20, big_font, 'black')
+    # Status Messages (pre-rendered: only the turn and check state pick between fixed lines)
+    status_lines = (turn_surfaces[turn], status_surfaces[danger], theme_hint_surface)
+    for i, text_surface in enumerate(status_lines):
+        screen.blit(text_surface, (panel_x, 20 + i * text_surface.get_height()))
 
     # Draw Move History
-    font_small = pygame.font.SysFont(None, 24)
     for i, move in enumerate(move_history[-10:]):
         piece_type = move.split()[0]
-        color_text = pygame.Color("white") if piece_type.startswith("w") else pygame.Color("black")
-        text = font_small.render(move, True, color_text)
+        color_text = WHITE if piece_type.startswith("w") else BLACK
+        text = render_cached(move, color_text)
         screen.blit(text, (BOARD_WIDTH + 40, 100 + i * 20))
 
     # Draw Game Over Banner
@@ -597,21 +976,40 @@ def Draw_board(light_color, dark_color, meow_mode, piece_images, font):
         screen.blit(msg, msg_rect)
 
     # Draw Board Coordinates (Ranks and Files)
-    font_coords = pygame.font.SysFont(None, 24)
     for col in range(8):
-        letter = chr(97 + col)
-        text = font_coords.render(letter, True, 'black')
+        text = file_labels[col]
         x = board_start_x + col * TILE_SIZE + TILE_SIZE // 2 - text.get_width() // 2
         y = board_start_y + TILE_SIZE * 8 + 5
         screen.blit(text, (x, y))
 
     for row in range(8):
-        number = str(8 - row)
-        text = font_coords.render(number, True, 'black')
+        text = rank_labels[row]
         x = board_start_x - text.get_width() - 5
         y = board_start_y + row * TILE_SIZE + TILE_SIZE // 2 - text.get_height() // 2
         screen.blit(text, (x, y))
 
+    # Compare what was drawn with the previous frame so only the changed areas reach the display
+    dirty_rects = []
+    previous_tiles = last_drawn.get('tiles')
+    for square, tile in enumerate(tiles):
+        if previous_tiles is None or previous_tiles[square] != tile:
+            row, col = square_coords(square)
+            dirty_rects.append(pygame.Rect(board_start_x + col * TILE_SIZE, board_start_y + row * TILE_SIZE,
+                                           TILE_SIZE, TILE_SIZE))
+
+    banner = (game_ended, winner_text)
+    if last_drawn.get('banner') != banner:
+        dirty_rects.append(pygame.Rect(board_start_x, board_start_y, BOARD_WIDTH, BOARD_HEIGHT))
+
+    panel = (turn, danger, tuple(move_history[-10:]))
+    if last_drawn.get('panel') != panel:
+        dirty_rects.append(pygame.Rect(panel_x - 10, panel_y, panel_width, panel_height))
+    elif last_drawn.get('hovered') != hovered:
+        dirty_rects.append(restart_rect)
+
+    last_drawn.update(tiles=tiles, banner=banner, panel=panel, hovered=hovered)
+    return dirty_rects
+
 
 def has_legal_moves(board, turn):
     color = 1 if turn == 'w' else -1
@@ -641,140 +1039,182 @@ def check_game_end(board, current_turn):
     return False
 
 
-# === Initialization ===
-TILE_SIZE = 75
-LABEL_MARGIN = 24
-BOARD_WIDTH = TILE_SIZE * 8
-BOARD_HEIGHT = TILE_SIZE * 8
-WIDTH = BOARD_WIDTH + 300 + LABEL_MARGIN * 2
-HEIGHT = BOARD_HEIGHT + LABEL_MARGIN * 2
-
-pygame.init()
-pygame.display.set_caption('BEST CHESS GAME EVER!')
-screen = pygame.display.set_mode([WIDTH, HEIGHT])
-font = pygame.font.SysFont('arial', 20)
-giant_font = pygame.font.SysFont('arial', 50)
-big_font = pygame.font.SysFont('arial', 20)
-timer = pygame.time.Clock()
-fps = 60
-piece_images = load_images(TILE_SIZE)
-
-board_themes = [
-    ('burlywood', 'sienna'), ('azure', 'darkorange'), ('whitesmoke', 'crimson'),
-    ('lemonchiffon', 'mediumvioletred'), ('peachpuff', 'steelblue'),
-    ('lightgoldenrodyellow', 'darkcyan'), ('antiquewhite', 'teal'),
-    ('seashell', 'firebrick'), ('tan', 'darkgreen'), ('wheat', 'darkslateblue'),
-    ('papayawhip', 'darkolivegreen'),
-]
-
-# Game State Variables
-board = create_initial_board()
-turn = 'w'
-game_fsm_state = "select"
-move_start = None
-game_ended = False
-move_history = []
-captured_pieces = {'w': [], 'b': []}
-meow_mode = False
-typed_keys = ''
-meow_timer = 0
-current_theme = 0
-restart_rect = pygame.Rect(0, 0, 0, 0)
-winner_text = ''
-
-# AI Setup
-ai_color = 'b'
-human_color = 'w'
-AI_DEPTH = 3
-
-# === Main Game Loop ===
-run = True
-while run:
-    timer.tick(fps)
-    screen.fill('white')
-    light_tile, dark_tile = board_themes[current_theme]
-    Draw_board(light_tile, dark_tile, meow_mode, piece_images, font)
-
-    if meow_mode:
-        meow_timer += 1
-        if meow_timer % 10 == 0:
-            current_theme = (current_theme + 1) % len(board_themes)
-
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            run = False
-
-        if event.type == pygame.KEYDOWN:
-            if not meow_mode:
-                typed_keys += event.unicode.lower()
-                typed_keys = typed_keys[-4:]
-                if typed_keys == 'cats':
-                    meow_mode = True
-            if event.key == pygame.K_c and not meow_mode:
-                current_theme = (current_theme + 1) % len(board_themes)
-
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            x, y = pygame.mouse.get_pos()
-
-            # 1. Restart Button Click
-            if restart_rect.collidepoint(x, y):
-                board = create_initial_board()
-                turn = 'w'
-                game_fsm_state = "select"
-                move_start = None
-                game_ended = False
-                move_history = []
-                captured_pieces = {'w': [], 'b': []}
-                winner_text = ''
-                continue
-
-            # 2. Board Click
-            if not game_ended and turn == human_color:
-                board_start_x = LABEL_MARGIN
-                board_start_y = 10
-
-                col = (x - board_start_x) // TILE_SIZE
-                row = (y - board_start_y) // TILE_SIZE
-
-                if 0 <= row < 8 and 0 <= col < 8:
-                    if game_fsm_state == "select":
-                        if board[row][col].startswith(turn):
-                            move_start = (row, col)
-                            game_fsm_state = "move"
-                    elif game_fsm_state == "move":
-                        move_end = (row, col)
-
-                        if make_move(board, move_start, move_end, turn, move_history, captured_pieces):
-                            if check_game_end(board, switch_turn(turn)):
-                                game_ended = True
-                            turn = switch_turn(turn)
-
-                        game_fsm_state = "select"
-                        move_start = None
-                        move_end = None
-
-    # === AI TURN ===
-    if not game_ended and turn == ai_color:
-
-        Draw_board(light_tile, dark_tile, meow_mode, piece_images, font)
-        pygame.display.flip()
-
-        pygame.time.delay(1000)
-
-        color_ai_int = 1 if ai_color == 'w' else -1
-        best_move = bot_plays(board, depth=AI_DEPTH, color=color_ai_int)
-
-        if best_move:
-            start, end = best_move
-            if make_move(board, start, end, turn, move_history, captured_pieces):
-                if check_game_end(board, switch_turn(turn)):
-                    game_ended = True
-                turn = switch_turn(turn)
-            # No 'else' needed; AI moves should always be legal due to all_moves() filter
-        else:
-            # Should only happen if check_game_end missed a terminal state
-            game_ended = True
+if __name__ == '__main__':
+    # === Initialization ===
+    TILE_SIZE = 75
+    LABEL_MARGIN = 24
+    BOARD_WIDTH = TILE_SIZE * 8
+    BOARD_HEIGHT = TILE_SIZE * 8
+    WIDTH = BOARD_WIDTH + 300 + LABEL_MARGIN * 2
+    HEIGHT = BOARD_HEIGHT + LABEL_MARGIN * 2
+
+    pygame.init()
+    pygame.display.set_caption('BEST CHESS GAME EVER!')
+    screen = pygame.display.set_mode([WIDTH, HEIGHT])
+    font = pygame.font.SysFont('arial', 20)
+    giant_font = pygame.font.SysFont('arial', 50)
+    big_font = pygame.font.SysFont('arial', 20)
+    font_small = pygame.font.SysFont(None, 24)
+    font_coords = pygame.font.SysFont(None, 24)
+    file_labels, rank_labels = render_coordinate_labels(font_coords)
+    board_surfaces = {}  # (light, dark) theme -> pre-rendered empty board
+    last_drawn = {}  # Tiles, banner, panel and button hover as of the last Draw_board call
+
+    # History text colors, as tuples so they can key render_cached
+    WHITE = tuple(pygame.Color('white'))
+    BLACK = tuple(pygame.Color('black'))
+
+    # Side panel lines that only ever take a few fixed values
+    restart_surface = big_font.render("Click to Restart", True, 'black')
+    turn_surfaces = {'w': big_font.render("Turn: White", True, 'black'),
+                     'b': big_font.render("Turn: Black", True, 'black')}
+    status_surfaces = {'w': big_font.render("White king is in check!", True, 'black'),
+                       'b': big_font.render("Black king is in check!", True, 'black'),
+                       None: big_font.render("  `\\_(^-^)_/`  ", True, 'black')}
+    theme_hint_surface = big_font.render("Press C to change theme", True, 'black')
+    timer = pygame.time.Clock()
+    fps = 60
+    piece_images = load_images(TILE_SIZE)
+
+    board_themes = [
+        ('burlywood', 'sienna'), ('azure', 'darkorange'), ('whitesmoke', 'crimson'),
+        ('lemonchiffon', 'mediumvioletred'), ('peachpuff', 'steelblue'),
+        ('lightgoldenrodyellow', 'darkcyan'), ('antiquewhite', 'teal'),
+        ('seashell', 'firebrick'), ('tan', 'darkgreen'), ('wheat', 'darkslateblue'),
+        ('papayawhip', 'darkolivegreen'),
+    ]
+
+    # Game State Variables
+    board = create_initial_board()
+    turn = 'w'
+    game_fsm_state = "select"
+    move_start = None
+    game_ended = False
+    move_history = []
+    captured_pieces = {'w': [], 'b': []}
+    meow_mode = False
+    typed_keys = ''
+    meow_timer = 0
+    current_theme = 0
+    restart_rect = pygame.Rect(0, 0, 0, 0)
+    winner_text = ''
+
+    # AI Setup
+    ai_color = 'b'
+    human_color = 'w'
+    AI_DEPTH = 3
+
+    # === Main Game Loop ===
+    run = True
+    needs_redraw = True  # Set whenever something visible changes; idle frames skip drawing entirely
+    full_redraw = True  # First frame, theme change or window exposed: push the whole window, not just the dirty rects
+    restart_hovered = False
+    while run:
+        timer.tick(fps)
+        light_tile, dark_tile = board_themes[current_theme]
+        if needs_redraw:
+            screen.fill('white')
+            dirty_rects = Draw_board(light_tile, dark_tile, meow_mode, piece_images, font)
+            if full_redraw:
+                pygame.display.flip()
+                full_redraw = False
+            else:
+                pygame.display.update(dirty_rects)
+            needs_redraw = False
 
-    pygame.display.flip()
+        if meow_mode:
+            meow_timer += 1
+            if meow_timer % 10 == 0:
+                current_theme = (current_theme + 1) % len(board_themes)
+                needs_redraw = full_redraw = True
+
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                run = False
+
+            if event.type == pygame.VIDEOEXPOSE:
+                needs_redraw = full_redraw = True
+
+            if event.type == pygame.MOUSEMOTION:
+                # Only the restart button reacts to hovering
+                hovered = restart_rect.collidepoint(event.pos)
+                if hovered != restart_hovered:
+                    restart_hovered = hovered
+                    needs_redraw = True
+
+            if event.type == pygame.KEYDOWN:
+                needs_redraw = True
+                if not meow_mode:
+                    typed_keys += event.unicode.lower()
+                    typed_keys = typed_keys[-4:]
+                    if typed_keys == 'cats':
+                        meow_mode = True
+                if event.key == pygame.K_c and not meow_mode:
+                    current_theme = (current_theme + 1) % len(board_themes)
+                    full_redraw = True
+
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                needs_redraw = True
+                x, y = pygame.mouse.get_pos()
+
+                # 1. Restart Button Click
+                if restart_rect.collidepoint(x, y):
+                    board = create_initial_board()
+                    turn = 'w'
+                    game_fsm_state = "select"
+                    move_start = None
+                    game_ended = False
+                    move_history = []
+                    captured_pieces = {'w': [], 'b': []}
+                    winner_text = ''
+                    continue
+
+                # 2. Board Click
+                if not game_ended and turn == human_color:
+                    board_start_x = LABEL_MARGIN
+                    board_start_y = 10
+
+                    col = (x - board_start_x) // TILE_SIZE
+                    row = (y - board_start_y) // TILE_SIZE
+
+                    if 0 <= row < 8 and 0 <= col < 8:
+                        if game_fsm_state == "select":
+                            if board.piece_at(row, col).startswith(turn):
+                                move_start = (row, col)
+                                game_fsm_state = "move"
+                        elif game_fsm_state == "move":
+                            move_end = (row, col)
+
+                            if make_move(board, move_start, move_end, turn, move_history, captured_pieces):
+                                if check_game_end(board, switch_turn(turn)):
+                                    game_ended = True
+                                turn = switch_turn(turn)
+
+                            game_fsm_state = "select"
+                            move_start = None
+                            move_end = None
+
+        # === AI TURN ===
+        if not game_ended and turn == ai_color:
+
+            screen.fill('white')
+            pygame.display.update(Draw_board(light_tile, dark_tile, meow_mode, piece_images, font))
+
+            pygame.time.delay(1000)
+
+            color_ai_int = 1 if ai_color == 'w' else -1
+            best_move = bot_plays(board, depth=AI_DEPTH, color=color_ai_int)
+
+            if best_move:
+                start, end = square_coords(best_move[0]), square_coords(best_move[1])
+                if make_move(board, start, end, turn, move_history, captured_pieces):
+                    if check_game_end(board, switch_turn(turn)):
+                        game_ended = True
+                    turn = switch_turn(turn)
+                # No 'else' needed; AI moves should always be legal due to all_moves() filter
+            else:
+                # Should only happen if check_game_end missed a terminal state
+                game_ended = True
+            needs_redraw = True
 
-pygame.quit()
\ No newline at end of file
+    pygame.quit()
\ No newline at end of file
@@ -0,0 +1,28 @@
+import random
+
+import pytest
+
+from ChessAI import all_moves, create_initial_board, piece_val_score
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_make_unmake_keeps_hash_and_material(seed):
+    # The search never copies the board, so make/unmake must keep the incremental state exact
+    rng = random.Random(seed)
+    board = create_initial_board()
+    color = 1
+    undos = []
+    for _ in range(80):
+        moves = all_moves(board, color)
+        if not moves:
+            break
+        undos.append(board.make(rng.choice(moves)))
+        color = -color
+        assert board.hash == board.compute_hash()
+        assert board.material == piece_val_score(board)
+
+    while undos:
+        board.unmake(undos.pop())
+        assert board.hash == board.compute_hash()
+        assert board.material == piece_val_score(board)
+    assert board == create_initial_board()